@@ -8,228 +8,451 @@ Enhanced: June 2025
 """
 
 import subprocess
+import heapq
 import json
 import os
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import re
 
-def run_command(cmd: str) -> Tuple[str, int]:
-    """Run shell command and return output and exit code"""
+def run_command(cmd: List[str]) -> Tuple[str, int]:
+    """Run a command (argv list, no shell) and return output and exit code"""
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(cmd, capture_output=True, text=True)
         return result.stdout.strip(), result.returncode
     except Exception as e:
         return f"Error: {e}", 1
 
+def run_command_bytes(cmd: List[str]) -> Tuple[bytes, int]:
+    """Run a command and return raw stdout bytes and exit code
+
+    Skips the full UTF-8 decode for callers that only display a slice.
+    """
+    try:
+        result = subprocess.run(cmd, capture_output=True)
+        return result.stdout, result.returncode
+    except Exception as e:
+        return f"Error: {e}".encode(), 1
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def bytes_to_human(bytes_val: int) -> str:
     """Convert bytes to human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_val < 1024.0:
-            return f"{bytes_val:.2f} {unit}"
-        bytes_val /= 1024.0
-    return f"{bytes_val:.2f} PB"
-
-def parse_file_size(size_str: str) -> int:
-    """Parse file size from ls -lh output to bytes"""
-    if not size_str:
-        return 0
-    
-    # Handle different size formats (K, M, G, T)
-    size_str = size_str.upper().strip()
-    multipliers = {'B': 1, 'K': 1024, 'M': 1024**2, 'G': 1024**3, 'T': 1024**4}
-    
-    # Extract number and unit
-    match = re.match(r'^(\d+\.?\d*)([KMGT]?)$', size_str)
-    if match:
-        number, unit = match.groups()
-        return int(float(number) * multipliers.get(unit, 1))
-    return 0
+    # Units sit at 10-bit intervals, so bit_length picks the unit directly -
+    # one shift and one division instead of up to 5 float divides
+    index = min((int(bytes_val).bit_length() - 1) // 10, 5) if bytes_val else 0
+    return f"{bytes_val / (1 << (index * 10)):.2f} {_BYTE_UNITS[index]}"
+
+# Trees we never descend into when walking in-process (firmlinks, swap, devices)
+_DU_SKIP_PATHS = {
+    '/dev',
+    '/System/Volumes/Data/private/var/vm',
+    '/private/var/vm',
+}
+
+def fast_du(root: str, workers: int = 8) -> int:
+    """Compute total size of a directory tree with a parallel os.scandir walk
+
+    In-process replacement for `du -sh` - walks directories on a small
+    thread pool instead of forking a subprocess that crawls the whole tree
+    sequentially. Uses entry.stat(follow_symlinks=False) so sizes come
+    straight from the directory scan, and never crosses mount boundaries.
+    Returns total bytes (format dengan bytes_to_human kalau mau ditampilkan).
+    """
+    total = 0
+    total_lock = threading.Lock()
+    dirs: queue.Queue = queue.Queue()
+    dirs.put(root)
+
+    def worker():
+        nonlocal total
+        while True:
+            dirpath = dirs.get()
+            if dirpath is None:
+                dirs.task_done()
+                return
+            local_total = 0
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if (entry.path not in _DU_SKIP_PATHS
+                                        and not os.path.ismount(entry.path)):
+                                    dirs.put(entry.path)
+                            else:
+                                local_total += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            if local_total:
+                with total_lock:
+                    total += local_total
+            dirs.task_done()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for t in threads:
+        t.start()
+    dirs.join()
+    for _ in threads:
+        dirs.put(None)
+    for t in threads:
+        t.join()
+    return total
+
+# SAFE TO DELETE
+_SAFE_PATTERNS = [
+    # Cache files
+    ('/cache/', 'Cache file - safe untuk dihapus', '✅ SAFE'),
+    ('/caches/', 'Cache file - safe untuk dihapus', '✅ SAFE'),
+    ('.cache', 'Cache file - safe untuk dihapus', '✅ SAFE'),
+    
+    # Log files (older than current)
+    ('.log.', 'Old log file - biasanya safe dihapus', '✅ SAFE'),
+    ('.out', 'Output file - kemungkinan safe dihapus', '⚠️ PROBABLY SAFE'),
+    
+    # Temporary files
+    ('/tmp/', 'Temporary file - safe untuk dihapus', '✅ SAFE'),
+    ('/temp/', 'Temporary file - safe untuk dihapus', '✅ SAFE'),
+    ('.tmp', 'Temporary file - safe untuk dihapus', '✅ SAFE'),
+    
+    # Download duplicates
+    (' (1)', 'Duplicate download - cek dulu sebelum hapus', '⚠️ CHECK FIRST'),
+    (' copy', 'Copy file - cek dulu sebelum hapus', '⚠️ CHECK FIRST'),
+    
+    # Old backups
+    ('.bak', 'Backup file - cek umur file dulu', '⚠️ CHECK DATE'),
+    ('.backup', 'Backup file - cek umur file dulu', '⚠️ CHECK DATE'),
+]
+
+# DANGEROUS TO DELETE
+_DANGEROUS_PATTERNS = [
+    # System files
+    ('/system/', 'System file - JANGAN DIHAPUS!', '❌ DANGEROUS'),
+    ('/usr/', 'System file - JANGAN DIHAPUS!', '❌ DANGEROUS'),
+    ('/bin/', 'System binary - JANGAN DIHAPUS!', '❌ DANGEROUS'),
+    ('/sbin/', 'System binary - JANGAN DIHAPUS!', '❌ DANGEROUS'),
+    ('/etc/', 'System config - JANGAN DIHAPUS!', '❌ DANGEROUS'),
+    
+    # Application files
+    ('.app/', 'Application - JANGAN DIHAPUS!', '❌ DANGEROUS'),
+    ('.framework/', 'Framework - JANGAN DIHAPUS!', '❌ DANGEROUS'),
+    
+    # Current logs
+    ('system.log', 'Active system log - JANGAN DIHAPUS!', '❌ DANGEROUS'),
+    ('kernel.log', 'Kernel log - JANGAN DIHAPUS!', '❌ DANGEROUS'),
+    
+    # User documents
+    ('/documents/', 'User document - cek dulu!', '⚠️ USER DATA'),
+    ('/desktop/', 'Desktop file - cek dulu!', '⚠️ USER DATA'),
+    ('/downloads/', 'Download file - cek dulu!', '⚠️ USER DATA'),
+]
+
+def _compile_patterns(patterns: List[Tuple[str, str, str]]):
+    """Compile substring patterns into one alternation regex + metadata map
+
+    One C-level regex scan per path instead of a Python-level `in` check
+    per pattern. Each alternative gets a named group so the match maps
+    back to its (reason, recommendation) via lastgroup.
+    """
+    regex = re.compile('|'.join(
+        f'(?P<g{i}>{re.escape(pattern)})'
+        for i, (pattern, _, _) in enumerate(patterns)
+    ))
+    meta = {f'g{i}': (reason, recommendation)
+            for i, (_, reason, recommendation) in enumerate(patterns)}
+    return regex, meta
 
-def is_safe_to_delete(filepath: str) -> Tuple[bool, str, str]:
+_SAFE_RE, _SAFE_META = _compile_patterns(_SAFE_PATTERNS)
+_DANGEROUS_RE, _DANGEROUS_META = _compile_patterns(_DANGEROUS_PATTERNS)
+
+@lru_cache(maxsize=4096)
+def _classify_dir(dirpath_lower: str) -> Tuple[str, str]:
+    """Classify the directory part of a path, memoized per directory
+
+    All files under the same cache/log directory hit the same patterns,
+    so the scan is paid once per directory instead of once per file.
+    Returns the matched group name per list ('' when no match).
+    """
+    dangerous = _DANGEROUS_RE.search(dirpath_lower)
+    safe = _SAFE_RE.search(dirpath_lower)
+    return (dangerous.lastgroup if dangerous else '',
+            safe.lastgroup if safe else '')
+
+def is_safe_to_delete(filepath: str, *, lower: Optional[str] = None) -> Tuple[bool, str, str]:
     """
     Determine if a file is safe to delete
+    Callers that already lowercased the path can pass it via `lower`
     Returns: (is_safe, reason, recommendation)
     """
-    filepath = filepath.lower()
+    filepath = lower if lower is not None else filepath.lower()
+    # Trailing slash so directory-suffix patterns like '.app/' still match
+    dirpart = os.path.dirname(filepath) + '/'
     filename = os.path.basename(filepath)
-    
-    # SAFE TO DELETE
-    safe_patterns = [
-        # Cache files
-        ('/cache/', 'Cache file - safe untuk dihapus', '✅ SAFE'),
-        ('/caches/', 'Cache file - safe untuk dihapus', '✅ SAFE'),
-        ('.cache', 'Cache file - safe untuk dihapus', '✅ SAFE'),
-        
-        # Log files (older than current)
-        ('.log.', 'Old log file - biasanya safe dihapus', '✅ SAFE'),
-        ('.out', 'Output file - kemungkinan safe dihapus', '⚠️ PROBABLY SAFE'),
-        
-        # Temporary files
-        ('/tmp/', 'Temporary file - safe untuk dihapus', '✅ SAFE'),
-        ('/temp/', 'Temporary file - safe untuk dihapus', '✅ SAFE'),
-        ('.tmp', 'Temporary file - safe untuk dihapus', '✅ SAFE'),
-        
-        # Download duplicates
-        (' (1)', 'Duplicate download - cek dulu sebelum hapus', '⚠️ CHECK FIRST'),
-        (' copy', 'Copy file - cek dulu sebelum hapus', '⚠️ CHECK FIRST'),
-        
-        # Old backups
-        ('.bak', 'Backup file - cek umur file dulu', '⚠️ CHECK DATE'),
-        ('.backup', 'Backup file - cek umur file dulu', '⚠️ CHECK DATE'),
-    ]
-    
-    # DANGEROUS TO DELETE
-    dangerous_patterns = [
-        # System files
-        ('/system/', 'System file - JANGAN DIHAPUS!', '❌ DANGEROUS'),
-        ('/usr/', 'System file - JANGAN DIHAPUS!', '❌ DANGEROUS'),
-        ('/bin/', 'System binary - JANGAN DIHAPUS!', '❌ DANGEROUS'),
-        ('/sbin/', 'System binary - JANGAN DIHAPUS!', '❌ DANGEROUS'),
-        ('/etc/', 'System config - JANGAN DIHAPUS!', '❌ DANGEROUS'),
-        
-        # Application files
-        ('.app/', 'Application - JANGAN DIHAPUS!', '❌ DANGEROUS'),
-        ('.framework/', 'Framework - JANGAN DIHAPUS!', '❌ DANGEROUS'),
-        
-        # Current logs
-        ('system.log', 'Active system log - JANGAN DIHAPUS!', '❌ DANGEROUS'),
-        ('kernel.log', 'Kernel log - JANGAN DIHAPUS!', '❌ DANGEROUS'),
-        
-        # User documents
-        ('/documents/', 'User document - cek dulu!', '⚠️ USER DATA'),
-        ('/desktop/', 'Desktop file - cek dulu!', '⚠️ USER DATA'),
-        ('/downloads/', 'Download file - cek dulu!', '⚠️ USER DATA'),
-    ]
-    
-    # Check dangerous patterns first
-    for pattern, reason, recommendation in dangerous_patterns:
-        if pattern in filepath:
-            return False, reason, recommendation
-    
+    dangerous_group, safe_group = _classify_dir(dirpart)
+
+    # Check dangerous patterns first (directory hit, then filename patterns
+    # like 'system.log' that genuinely depend on the name)
+    if not dangerous_group:
+        match = _DANGEROUS_RE.search(filename)
+        if match:
+            dangerous_group = match.lastgroup
+    if dangerous_group:
+        reason, recommendation = _DANGEROUS_META[dangerous_group]
+        return False, reason, recommendation
+
     # Check safe patterns
-    for pattern, reason, recommendation in safe_patterns:
-        if pattern in filepath:
-            return True, reason, recommendation
-    
+    if not safe_group:
+        match = _SAFE_RE.search(filename)
+        if match:
+            safe_group = match.lastgroup
+    if safe_group:
+        reason, recommendation = _SAFE_META[safe_group]
+        return True, reason, recommendation
+
     # Default: unknown file
     return False, 'File type tidak dikenal - cek manual dulu', '⚠️ UNKNOWN'
 
+# Key: value lines from diskutil info, parsed in one C-level pass
+_DISKUTIL_KV_RE = re.compile(r'^\s*([^:\n]+?)\s*:\s*(.*?)\s*$', re.M)
+
+# First six whitespace-separated columns of a df data row
+_DF_ROW_RE = re.compile(r'(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)')
+
 def get_df_info() -> Dict:
     """Get disk usage info from df command"""
     print("📊 Getting disk usage from df...")
-    output, _ = run_command("df -h /")
-    lines = output.split('\n')
-    if len(lines) >= 2:
-        data = lines[1].split()
-        return {
-            'filesystem': data[0],
-            'size': data[1],
-            'used': data[2],
-            'available': data[3],
-            'use_percent': data[4],
-            'mounted_on': data[5] if len(data) > 5 else data[-1]
-        }
+    output, _ = run_command(["df", "-h", "/"])
+    header_end = output.find('\n')
+    match = _DF_ROW_RE.match(output, header_end + 1) if header_end != -1 else None
+    if match:
+        return dict(zip(
+            ('filesystem', 'size', 'used', 'available', 'use_percent', 'mounted_on'),
+            match.groups()))
     return {}
 
+@lru_cache(maxsize=1)
 def get_diskutil_info() -> Dict:
-    """Get detailed disk info from diskutil"""
+    """Get detailed disk info from diskutil (cached - one fork per run)"""
     print("💾 Getting detailed disk info from diskutil...")
-    output, _ = run_command("diskutil info /")
-    info = {}
-    for line in output.split('\n'):
-        if ':' in line:
-            key, value = line.split(':', 1)
-            info[key.strip()] = value.strip()
-    return info
+    output, _ = run_command(["diskutil", "info", "/"])
+    return dict(_DISKUTIL_KV_RE.findall(output))
 
 def get_diskutil_list() -> str:
     """Get list of all disks"""
     print("📋 Getting disk list...")
-    output, _ = run_command("diskutil list")
+    output, _ = run_command(["diskutil", "list"])
     return output
 
 def get_storage_overview() -> Dict:
     """Get macOS storage overview using system_profiler"""
     print("🖥️  Getting system storage overview...")
-    output, _ = run_command("system_profiler SPStorageDataType -json")
+    # Parse straight off the pipe - no full-output str + strip() copies
+    # before the JSON parser sees the bytes
     try:
-        data = json.loads(output)
+        with subprocess.Popen(["system_profiler", "SPStorageDataType", "-json"],
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL) as proc:
+            data = json.load(proc.stdout)
         return data.get('SPStorageDataType', [])
-    except json.JSONDecodeError:
+    except (OSError, json.JSONDecodeError):
         return {}
 
 def get_apfs_info() -> str:
-    """Get APFS container info"""
+    """Get APFS container info, truncated to the displayed first KB"""
     print("📦 Getting APFS container information...")
-    output, _ = run_command("diskutil apfs list")
-    return output
+    output, _ = run_command_bytes(["diskutil", "apfs", "list"])
+    # Decode only what gets shown instead of the whole dump
+    if len(output) > 1000:
+        return output[:1000].decode('utf-8', errors='replace') + "..."
+    return output.decode('utf-8', errors='replace').strip()
+
+def _mdfind_large_files(search_roots: List[Tuple[str, str, int]]) -> List[str]:
+    """Query the Spotlight index for large files under each root
+
+    Spotlight answers from its prebuilt index in milliseconds (and without
+    sudo) where a cold find crawl takes seconds to minutes. An empty result
+    means the index doesn't cover these roots and the caller should fall
+    back to find.
+    """
+    candidates = []
+    for _, root_path, min_bytes in search_roots:
+        output, code = run_command(
+            ["mdfind", "-onlyin", root_path, f"kMDItemFSSize > {min_bytes}"])
+        if code != 0:
+            return []
+        if output:
+            candidates.extend(output.splitlines())
+    return candidates
+
+def _scan_root(root: str, min_bytes: int) -> List[Tuple[str, int]]:
+    """Walk one root with os.scandir collecting files of at least min_bytes
+
+    In-process replacement for the find crawl: one getdents per directory
+    and a dirent-backed stat per entry, no shell or sudo. Directories we
+    can't read (SIP-protected system paths) are skipped per-entry.
+    """
+    matches = []
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            size = entry.stat(follow_symlinks=False).st_size
+                            if size >= min_bytes:
+                                matches.append((entry.path, size))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return matches
+
+def scan_large_files(search_roots: List[Tuple[str, str, int]]) -> List[Tuple[str, int]]:
+    """Scan all roots concurrently, returning (path, size) pairs
+
+    Each root is walked on its own thread - the walks are I/O bound, so
+    the scans overlap instead of running back to back.
+    """
+    with ThreadPoolExecutor(max_workers=len(search_roots)) as executor:
+        futures = [executor.submit(_scan_root, root_path, min_bytes)
+                   for _, root_path, min_bytes in search_roots]
+        return [pair for future in futures for pair in future.result()]
+
+# How many of the largest files to keep - well above every display cap
+_TOP_FILES = 200
 
 def analyze_large_files() -> List[Dict]:
     """Find largest files with detailed info and safety analysis"""
     print("🔍 Analyzing large files and directories...")
-    large_files = []
-    
-    # Commands to find large files with detailed info
-    commands = [
-        ("System Logs", "sudo find /private/var/log -type f -size +50M -exec ls -lh {} \\; 2>/dev/null"),
-        ("System Caches", "sudo find /Library/Caches -type f -size +50M -exec ls -lh {} \\; 2>/dev/null"),
-        ("User Caches", "find ~/Library/Caches -type f -size +50M -exec ls -lh {} \\; 2>/dev/null"),
-        ("User Downloads", "find ~/Downloads -type f -size +100M -exec ls -lh {} \\; 2>/dev/null"),
-        ("Application Support", "find ~/Library/Application\\ Support -type f -size +100M -exec ls -lh {} \\; 2>/dev/null"),
-        ("Trash (if accessible)", "find ~/.Trash -type f -size +50M -exec ls -lh {} \\; 2>/dev/null"),
+    # Bounded min-heap of (size, seq, record) - memory stays O(K) no matter
+    # how many files match, and the smallest entry is evicted as we go
+    heap: List[Tuple[int, int, Dict]] = []
+    total_matched_bytes = 0
+    matched_count = 0
+
+    # Locations to scan with their size thresholds
+    # One find over all roots instead of 6 shell + find + per-file ls forks
+    search_roots = [
+        ("System Logs", "/private/var/log", 50 * 1024**2),
+        ("System Caches", "/Library/Caches", 50 * 1024**2),
+        ("User Caches", os.path.expanduser("~/Library/Caches"), 50 * 1024**2),
+        ("User Downloads", os.path.expanduser("~/Downloads"), 100 * 1024**2),
+        ("Application Support", os.path.expanduser("~/Library/Application Support"), 100 * 1024**2),
+        ("Trash (if accessible)", os.path.expanduser("~/.Trash"), 50 * 1024**2),
     ]
-    
-    for category, cmd in commands:
-        print(f"   Scanning {category}...")
-        output, code = run_command(cmd)
-        if code == 0 and output:
-            lines = output.strip().split('\n')
-            for line in lines:
-                if line.strip():
-                    # Parse ls -lh output
-                    parts = line.split()
-                    if len(parts) >= 9:
-                        size_str = parts[4]
-                        filepath = ' '.join(parts[8:])
-                        size_bytes = parse_file_size(size_str)
-                        
-                        is_safe, reason, recommendation = is_safe_to_delete(filepath)
-                        
-                        large_files.append({
-                            'category': category,
-                            'filepath': filepath,
-                            'size_human': size_str,
-                            'size_bytes': size_bytes,
-                            'is_safe': is_safe,
-                            'reason': reason,
-                            'recommendation': recommendation
-                        })
-    
-    # Sort by size (largest first)
-    large_files.sort(key=lambda x: x['size_bytes'], reverse=True)
-    return large_files
 
-def check_hidden_usage() -> Dict:
-    """Check for hidden disk usage"""
+    print("   Scanning all locations in one pass...")
+
+    # Spotlight fast path: ask the prebuilt index before walking the trees
+    candidates = _mdfind_large_files(search_roots)
+    if candidates:
+        pairs = []
+        for filepath in candidates:
+            try:
+                pairs.append((filepath, os.stat(filepath).st_size))
+            except OSError:
+                continue
+    else:
+        # Walk all roots in-process with os.scandir - no find, no shell,
+        # no sudo, and sizes come straight from the directory scan
+        pairs = scan_large_files(search_roots)
+
+    for filepath, size_bytes in pairs:
+        # Tag category by matching the path prefix against the root list
+        category = None
+        min_bytes = 0
+        for root_category, root_path, root_min in search_roots:
+            if filepath.startswith(root_path + os.sep):
+                category, min_bytes = root_category, root_min
+                break
+        if category is None:
+            continue
+        if size_bytes < min_bytes:
+            continue
+
+        # Lowercase once here instead of inside the classifier
+        lower_path = filepath.lower()
+        is_safe, reason, recommendation = is_safe_to_delete(filepath, lower=lower_path)
+
+        record = {
+            'category': category,
+            'filepath': filepath,
+            'size_human': bytes_to_human(size_bytes),
+            'size_bytes': size_bytes,
+            'is_safe': is_safe,
+            'reason': reason,
+            'recommendation': recommendation
+        }
+
+        # Totals cover every match, including entries the heap evicts
+        total_matched_bytes += size_bytes
+        matched_count += 1
+        item = (size_bytes, matched_count, record)
+        if len(heap) < _TOP_FILES:
+            heapq.heappush(heap, item)
+        else:
+            heapq.heappushpop(heap, item)
+
+    _classify_dir.cache_clear()
+
+    if matched_count:
+        print(f"   Matched {matched_count} files, "
+              f"{bytes_to_human(total_matched_bytes)} total")
+
+    # Largest first
+    return [record for _, _, record in sorted(heap, reverse=True)]
+
+def check_hidden_usage(executor: Optional[ThreadPoolExecutor] = None) -> Dict:
+    """Check for hidden disk usage
+
+    The three probes are independent subprocesses, so they run
+    concurrently - on a shared executor when one is passed in.
+    """
     print("👻 Checking for hidden disk usage...")
     hidden_info = {}
-    
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=3)
+
     # Check Time Machine local snapshots
-    output, _ = run_command("tmutil listlocalsnapshots /")
-    hidden_info['time_machine_snapshots'] = output.split('\n') if output else []
-    
-    # Check for purgeable space
-    output, _ = run_command("diskutil info / | grep -i purgeable")
-    hidden_info['purgeable_info'] = output
-    
-    # Check mobile device backups
+    snapshots_future = executor.submit(run_command, ["tmutil", "listlocalsnapshots", "/"])
+
+    # Check for purgeable space (reuses the cached diskutil info parse
+    # instead of forking diskutil a second time)
+    purgeable_future = executor.submit(get_diskutil_info)
+
+    # Check mobile device backups (in-process walk instead of forking du,
+    # which crawls tens of thousands of backup files sequentially)
     backup_path = os.path.expanduser("~/Library/Application Support/MobileSync/Backup")
-    if os.path.exists(backup_path):
-        output, _ = run_command(f"du -sh '{backup_path}' 2>/dev/null")
-        hidden_info['ios_backups'] = output
-    
+    backup_future = None
+    if os.path.isdir(backup_path):
+        backup_future = executor.submit(fast_du, backup_path, 4)
+
+    output, _ = snapshots_future.result()
+    hidden_info['time_machine_snapshots'] = output.splitlines() if output else []
+
+    diskutil_info = purgeable_future.result()
+    hidden_info['purgeable_info'] = '\n'.join(
+        f"{key}: {value}" for key, value in diskutil_info.items()
+        if 'purgeable' in key.lower())
+
+    if backup_future is not None:
+        hidden_info['ios_backups'] = f"{bytes_to_human(backup_future.result())}  {backup_path}"
+
+    if own_executor:
+        executor.shutdown()
     return hidden_info
 
 def prompt_file_deletion(large_files: List[Dict]):
@@ -254,44 +477,50 @@ def prompt_file_deletion(large_files: List[Dict]):
     print(f"   Needs review: {len(unsafe_files)} files ({bytes_to_human(total_space_unsafe)})")
     
     if safe_files:
-        print(f"\n✅ SAFE FILES TO DELETE:")
-        print(f"{'No':<3} {'Size':<10} {'Category':<15} {'File':<50} {'Status'}")
-        print("-" * 90)
-        
+        # Build the table once and write it in one go instead of a
+        # flush-per-row print loop
+        rows = ["\n✅ SAFE FILES TO DELETE:",
+                f"{'No':<3} {'Size':<10} {'Category':<15} {'File':<50} {'Status'}",
+                "-" * 90]
         for i, file_info in enumerate(safe_files[:10], 1):
             filepath_short = file_info['filepath']
             if len(filepath_short) > 45:
                 filepath_short = "..." + filepath_short[-42:]
-            
-            print(f"{i:<3} {file_info['size_human']:<10} {file_info['category'][:14]:<15} {filepath_short:<50} {file_info['recommendation']}")
-        
+            rows.append(f"{i:<3} {file_info['size_human']:<10} {file_info['category'][:14]:<15} {filepath_short:<50} {file_info['recommendation']}")
         if len(safe_files) > 10:
-            print(f"... and {len(safe_files) - 10} more files")
-        
-        print(f"\nTotal space yang bisa dihemat: {bytes_to_human(total_space_safe)}")
+            rows.append(f"... and {len(safe_files) - 10} more files")
+        rows.append(f"\nTotal space yang bisa dihemat: {bytes_to_human(total_space_safe)}")
+        sys.stdout.write('\n'.join(rows) + '\n')
+        sys.stdout.flush()
         
         while True:
             choice = input(f"\n🤔 Mau delete semua safe files? (y/n/list): ").lower().strip()
             
             if choice == 'y':
-                deleted_count = 0
-                deleted_size = 0
-                
                 print("\n🗑️  Deleting safe files...")
-                for file_info in safe_files:
+
+                def _try_unlink(file_info: Dict) -> Tuple[bool, int, str]:
+                    # One unlink syscall per file - a missing file raises
+                    # FileNotFoundError, replacing the old exists() probe
+                    filepath = file_info['filepath']
                     try:
-                        if os.path.exists(file_info['filepath']):
-                            os.remove(file_info['filepath'])
-                            deleted_count += 1
-                            deleted_size += file_info['size_bytes']
-                            print(f"   ✅ Deleted: {file_info['filepath']}")
-                        else:
-                            print(f"   ⚠️  File not found: {file_info['filepath']}")
+                        os.remove(filepath)
+                        return True, file_info['size_bytes'], f"   ✅ Deleted: {filepath}"
+                    except FileNotFoundError:
+                        return False, 0, f"   ⚠️  File not found: {filepath}"
                     except PermissionError:
-                        print(f"   ❌ Permission denied: {file_info['filepath']}")
+                        return False, 0, f"   ❌ Permission denied: {filepath}"
                     except Exception as e:
-                        print(f"   ❌ Error deleting {file_info['filepath']}: {e}")
-                
+                        return False, 0, f"   ❌ Error deleting {filepath}: {e}"
+
+                # Unlinks are independent and I/O bound - overlap them
+                with ThreadPoolExecutor(max_workers=16) as delete_pool:
+                    results = list(delete_pool.map(_try_unlink, safe_files))
+
+                deleted_count = sum(1 for ok, _, _ in results if ok)
+                deleted_size = sum(size for _, size, _ in results)
+                print('\n'.join(line for _, _, line in results))
+
                 print(f"\n🎉 CLEANUP COMPLETE!")
                 print(f"   Files deleted: {deleted_count}")
                 print(f"   Space freed: {bytes_to_human(deleted_size)}")
@@ -312,39 +541,48 @@ def prompt_file_deletion(large_files: List[Dict]):
                 print("   Please enter 'y', 'n', or 'list'")
     
     if unsafe_files:
-        print(f"\n⚠️  FILES THAT NEED MANUAL REVIEW:")
-        print(f"{'No':<3} {'Size':<10} {'Category':<15} {'File':<50} {'Status'}")
-        print("-" * 90)
-        
+        rows = ["\n⚠️  FILES THAT NEED MANUAL REVIEW:",
+                f"{'No':<3} {'Size':<10} {'Category':<15} {'File':<50} {'Status'}",
+                "-" * 90]
         for i, file_info in enumerate(unsafe_files[:5], 1):
             filepath_short = file_info['filepath']
             if len(filepath_short) > 45:
                 filepath_short = "..." + filepath_short[-42:]
-            
-            print(f"{i:<3} {file_info['size_human']:<10} {file_info['category'][:14]:<15} {filepath_short:<50} {file_info['recommendation']}")
-        
+            rows.append(f"{i:<3} {file_info['size_human']:<10} {file_info['category'][:14]:<15} {filepath_short:<50} {file_info['recommendation']}")
         if len(unsafe_files) > 5:
-            print(f"... and {len(unsafe_files) - 5} more files")
-        
-        print(f"\n⚠️  These files need manual review before deletion!")
-        print(f"   Total potential space: {bytes_to_human(total_space_unsafe)}")
+            rows.append(f"... and {len(unsafe_files) - 5} more files")
+        rows.append("\n⚠️  These files need manual review before deletion!")
+        rows.append(f"   Total potential space: {bytes_to_human(total_space_unsafe)}")
+        sys.stdout.write('\n'.join(rows) + '\n')
+        sys.stdout.flush()
 
 def main():
     """Main function to run all disk analysis"""
     print("🚀 Enhanced macOS Disk Utilization Inspector")
     print("=" * 60)
     print("Analyzing disk space dengan intelligent cleanup suggestions...\n")
-    
+
+    # Kick off the independent getters together - each mostly blocks on a
+    # subprocess, so threads overlap the waits and results are collected in
+    # the original print order below
+    executor = ThreadPoolExecutor(max_workers=8)
+    df_future = executor.submit(get_df_info)
+    diskutil_future = executor.submit(get_diskutil_info)
+    apfs_future = executor.submit(get_apfs_info)
+    storage_future = executor.submit(get_storage_overview)
+    hidden_future = executor.submit(check_hidden_usage, executor)
+    disk_list_future = executor.submit(get_diskutil_list)
+
     # Basic df info
     print("1️⃣  DF COMMAND OUTPUT:")
-    df_info = get_df_info()
+    df_info = df_future.result()
     for key, value in df_info.items():
         print(f"   {key}: {value}")
     print()
     
     # Detailed diskutil info
     print("2️⃣  DISKUTIL DETAILED INFO:")
-    diskutil_info = get_diskutil_info()
+    diskutil_info = diskutil_future.result()
     important_keys = ['Device Node', 'Volume Name', 'Total Size', 'Volume Free Space', 
                      'Volume Used Space', 'File System', 'APFS Physical Store']
     for key in important_keys:
@@ -354,13 +592,13 @@ def main():
     
     # APFS info
     print("3️⃣  APFS CONTAINER INFO:")
-    apfs_info = get_apfs_info()
-    print(apfs_info[:1000] + "..." if len(apfs_info) > 1000 else apfs_info)
+    apfs_info = apfs_future.result()
+    print(apfs_info)
     print()
     
     # Storage overview
     print("4️⃣  SYSTEM STORAGE OVERVIEW:")
-    storage_data = get_storage_overview()
+    storage_data = storage_future.result()
     if storage_data:
         for volume in storage_data:
             if 'mount_point' in volume and volume['mount_point'] == '/':
@@ -371,7 +609,7 @@ def main():
     
     # Hidden usage analysis
     print("5️⃣  HIDDEN USAGE ANALYSIS:")
-    hidden_info = check_hidden_usage()
+    hidden_info = hidden_future.result()
     
     if hidden_info['time_machine_snapshots']:
         print(f"   Time Machine Snapshots: {len(hidden_info['time_machine_snapshots'])} found")
@@ -390,20 +628,19 @@ def main():
     large_files = analyze_large_files()
     
     if large_files:
-        print(f"\n📊 FOUND {len(large_files)} LARGE FILES:")
-        print(f"{'No':<3} {'Size':<10} {'Category':<15} {'Safety':<15} {'File'}")
-        print("-" * 80)
-        
+        rows = [f"\n📊 FOUND {len(large_files)} LARGE FILES:",
+                f"{'No':<3} {'Size':<10} {'Category':<15} {'Safety':<15} {'File'}",
+                "-" * 80]
         for i, file_info in enumerate(large_files[:15], 1):
             filepath_short = file_info['filepath']
             if len(filepath_short) > 40:
                 filepath_short = "..." + filepath_short[-37:]
-            
-            print(f"{i:<3} {file_info['size_human']:<10} {file_info['category'][:14]:<15} {file_info['recommendation']:<15} {filepath_short}")
-        
+            rows.append(f"{i:<3} {file_info['size_human']:<10} {file_info['category'][:14]:<15} {file_info['recommendation']:<15} {filepath_short}")
         if len(large_files) > 15:
-            print(f"... and {len(large_files) - 15} more files")
-        
+            rows.append(f"... and {len(large_files) - 15} more files")
+        sys.stdout.write('\n'.join(rows) + '\n')
+        sys.stdout.flush()
+
         # Interactive cleanup
         try:
             prompt_file_deletion(large_files)
@@ -415,7 +652,8 @@ def main():
     
     # Disk list
     print("7️⃣  COMPLETE DISK LIST:")
-    disk_list = get_diskutil_list()
+    disk_list = disk_list_future.result()
+    executor.shutdown()
     print(disk_list)
     print()
     
@@ -3,8 +3,9 @@
 Interactive Large File Cleaner for macOS
 Finds large files and asks user one-by-one if they want to delete (move to Trash)
 
-Usage: python3 interactive_cleaner.py [min_size_mb]
+Usage: python3 interactive_cleaner.py [min_size_mb] [--batch]
 Example: python3 interactive_cleaner.py 100  # Find files larger than 100MB
+         python3 interactive_cleaner.py 100 --batch  # Commit deletions in Finder batches
 
 Author: Bernhard Hustomo
 Created: June 2025
@@ -14,212 +15,352 @@ import subprocess
 import os
 import sys
 import shutil
+import termios
+import time
+import tty
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Tuple
 import re
-from datetime import datetime
 
-def run_command(cmd: str) -> Tuple[str, int]:
-    """Run shell command and return output and exit code"""
-    try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        return result.stdout.strip(), result.returncode
-    except Exception as e:
-        return f"Error: {e}", 1
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 def bytes_to_human(bytes_val: int) -> str:
     """Convert bytes to human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_val < 1024.0:
-            return f"{bytes_val:.2f} {unit}"
-        bytes_val /= 1024.0
-    return f"{bytes_val:.2f} PB"
-
-def parse_file_size(size_str: str) -> int:
-    """Parse file size from ls -lh output to bytes"""
-    if not size_str:
-        return 0
-    
-    size_str = size_str.upper().strip()
-    multipliers = {'B': 1, 'K': 1024, 'M': 1024**2, 'G': 1024**3, 'T': 1024**4}
-    
-    match = re.match(r'^(\d+\.?\d*)([KMGT]?)$', size_str)
-    if match:
-        number, unit = match.groups()
-        return int(float(number) * multipliers.get(unit, 1))
-    return 0
-
-def get_file_info(filepath: str) -> Dict:
-    """Get detailed file information"""
-    try:
-        stat = os.stat(filepath)
-        modified_time = datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-        accessed_time = datetime.fromtimestamp(stat.st_atime).strftime('%Y-%m-%d %H:%M:%S')
-        
-        return {
-            'size_bytes': stat.st_size,
-            'size_human': bytes_to_human(stat.st_size),
-            'modified': modified_time,
-            'accessed': accessed_time,
-            'permissions': oct(stat.st_mode)[-3:],
-        }
-    except Exception as e:
-        return {'error': str(e)}
+    # Units are 10 bits apart, so bit_length indexes the table directly -
+    # one division instead of a float-divide loop
+    index = min((int(bytes_val).bit_length() - 1) // 10, 5) if bytes_val else 0
+    return f"{bytes_val / (1 << (index * 10)):.2f} {_UNITS[index]}"
+
+class FileRec(NamedTuple):
+    """One large-file scan result
+
+    A slotted fixed-shape record (~5x smaller than the per-file dicts it
+    replaces) with C-level attribute access in the sort and display paths.
+    """
+    size_bytes: int
+    filepath: str
+    mtime: float
+    atime: float
+    location: str = ''
+    safety_level: str = ''
+    reason: str = ''
+    recommendation: str = ''
+
+# Subtrees whose contents can only ever classify as DANGEROUS/kept -
+# pruning them at walk time skips thousands of pointless stats
+_PRUNE_DIR_SUFFIXES = ('.app', '.framework', '.bundle', '.kext')
+_PRUNE_DIR_PATHS = {'/System', '/usr/bin', '/sbin', '/private/var/db'}
+
+def _walk(root: str, min_bytes: int):
+    """Yield FileRec entries for files of at least min_bytes under root
+
+    Iterative os.scandir walk - no find subprocess, and sizes/timestamps
+    come from the dirent-backed DirEntry.stat(), so matching a file costs
+    no extra stat syscall. Unreadable directories are skipped per entry.
+    """
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if (entry.name.endswith(_PRUNE_DIR_SUFFIXES)
+                                or entry.path in _PRUNE_DIR_PATHS):
+                            continue
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        if stat.st_size >= min_bytes:
+                            # Raw numbers only; formatting happens for
+                            # files that actually get displayed
+                            yield FileRec(size_bytes=stat.st_size,
+                                          filepath=entry.path,
+                                          mtime=stat.st_mtime,
+                                          atime=stat.st_atime)
+                except OSError:
+                    continue
+
+# Pattern lists in priority order - dangerous wins over everything below it
+_DANGEROUS_PATTERNS = [
+    ('/system/', '🔴 System file', 'DANGEROUS - jangan dihapus!'),
+    ('/usr/', '🔴 System file', 'DANGEROUS - jangan dihapus!'),
+    ('/bin/', '🔴 System binary', 'DANGEROUS - jangan dihapus!'),
+    ('/sbin/', '🔴 System binary', 'DANGEROUS - jangan dihapus!'),
+    ('.app/', '🔴 Application', 'DANGEROUS - aplikasi aktif'),
+    ('.framework/', '🔴 Framework', 'DANGEROUS - system framework'),
+    ('system.log', '🔴 Active log', 'DANGEROUS - log aktif'),
+    ('/library/frameworks/', '🔴 System framework', 'DANGEROUS - jangan dihapus!'),
+]
+
+_NEEDS_REVIEW_PATTERNS = [
+    ('/downloads/', '🟠 Download file', 'NEEDS REVIEW - bisa jadi file penting'),
+    ('/documents/', '🟠 Document file', 'NEEDS REVIEW - kemungkinan dokumen penting'),
+    ('/desktop/', '🟠 Desktop file', 'NEEDS REVIEW - file di desktop'),
+    ('.mov', '🟠 Video file', 'NEEDS REVIEW - bisa jadi video penting'),
+    ('.mp4', '🟠 Video file', 'NEEDS REVIEW - bisa jadi video penting'),
+    ('.mkv', '🟠 Video file', 'NEEDS REVIEW - bisa jadi video penting'),
+    ('.avi', '🟠 Video file', 'NEEDS REVIEW - bisa jadi video penting'),
+    ('.iso', '🟠 Disk image', 'NEEDS REVIEW - bisa jadi backup penting'),
+]
+
+_PROBABLY_SAFE_PATTERNS = [
+    ('.dmg', '🟡 Disk image', 'PROBABLY SAFE - installer yang sudah selesai'),
+    ('.pkg', '🟡 Package file', 'PROBABLY SAFE - installer yang sudah selesai'),
+    ('.zip', '🟡 Archive file', 'PROBABLY SAFE - tapi cek dulu isinya'),
+    ('.rar', '🟡 Archive file', 'PROBABLY SAFE - tapi cek dulu isinya'),
+    ('.tar', '🟡 Archive file', 'PROBABLY SAFE - tapi cek dulu isinya'),
+    (' (1)', '🟡 Duplicate file', 'PROBABLY SAFE - kemungkinan duplicate'),
+    (' copy', '🟡 Copy file', 'PROBABLY SAFE - kemungkinan duplicate'),
+    ('/.trashes/', '🟡 Trash file', 'PROBABLY SAFE - file yang sudah di trash'),
+]
+
+_VERY_SAFE_PATTERNS = [
+    ('/cache/', '🟢 Cache file', 'VERY SAFE - biasanya bisa di-regenerate'),
+    ('/caches/', '🟢 Cache file', 'VERY SAFE - biasanya bisa di-regenerate'),
+    ('.cache', '🟢 Cache file', 'VERY SAFE - biasanya bisa di-regenerate'),
+    ('/tmp/', '🟢 Temporary file', 'VERY SAFE - file temporary'),
+    ('/temp/', '🟢 Temporary file', 'VERY SAFE - file temporary'),
+    ('.tmp', '🟢 Temporary file', 'VERY SAFE - file temporary'),
+    ('.log.', '🟢 Old log file', 'VERY SAFE - log file lama'),
+]
+
+_PATTERN_GROUPS = [
+    ('DANGEROUS', _DANGEROUS_PATTERNS),
+    ('NEEDS_REVIEW', _NEEDS_REVIEW_PATTERNS),
+    ('PROBABLY_SAFE', _PROBABLY_SAFE_PATTERNS),
+    ('VERY_SAFE', _VERY_SAFE_PATTERNS),
+]
+
+# Flattened (pattern, (rank, order, level, reason, recommendation)) entries;
+# min() over the meta tuples reproduces the old first-match-by-priority scan
+_PATTERN_ENTRIES = [
+    (pattern, (rank, order, level, reason, recommendation))
+    for rank, (level, patterns) in enumerate(_PATTERN_GROUPS)
+    for order, (pattern, reason, recommendation) in enumerate(patterns)
+]
+
+try:
+    import ahocorasick
+    _AUTOMATON = ahocorasick.Automaton()
+    for _pattern, _meta in _PATTERN_ENTRIES:
+        _AUTOMATON.add_word(_pattern, _meta)
+    _AUTOMATON.make_automaton()
+    _CLASSIFIER_RE = None
+    _CLASSIFIER_META = None
+except ImportError:
+    # Fallback: one alternation regex (still a single pass, dangerous first).
+    # Each alternative is a zero-width lookahead so overlapping patterns all
+    # report - a plain alternation would let e.g. '.log.' consume the dot of
+    # a following '.app/' and hide the dangerous match
+    _AUTOMATON = None
+    _CLASSIFIER_RE = re.compile('|'.join(
+        f'(?=(?P<g{i}>{re.escape(pattern)}))'
+        for i, (pattern, _) in enumerate(_PATTERN_ENTRIES)), re.IGNORECASE)
+    _CLASSIFIER_META = {f'g{i}': meta
+                        for i, (_, meta) in enumerate(_PATTERN_ENTRIES)}
 
 def is_safe_to_delete(filepath: str) -> Tuple[str, str, str]:
     """
     Determine if a file is safe to delete
+    Case-insensitive; costs at most one lowercased copy of the path per
+    call (none at all on the regex backend)
     Returns: (safety_level, reason, recommendation)
     """
-    filepath_lower = filepath.lower()
-    filename = os.path.basename(filepath_lower)
-    
-    # VERY SAFE - Auto-recommend deletion
-    very_safe_patterns = [
-        ('/cache/', '🟢 Cache file', 'VERY SAFE - biasanya bisa di-regenerate'),
-        ('/caches/', '🟢 Cache file', 'VERY SAFE - biasanya bisa di-regenerate'),
-        ('.cache', '🟢 Cache file', 'VERY SAFE - biasanya bisa di-regenerate'),
-        ('/tmp/', '🟢 Temporary file', 'VERY SAFE - file temporary'),
-        ('/temp/', '🟢 Temporary file', 'VERY SAFE - file temporary'),
-        ('.tmp', '🟢 Temporary file', 'VERY SAFE - file temporary'),
-        ('.log.', '🟢 Old log file', 'VERY SAFE - log file lama'),
-    ]
-    
-    # PROBABLY SAFE - Ask for confirmation
-    probably_safe_patterns = [
-        ('.dmg', '🟡 Disk image', 'PROBABLY SAFE - installer yang sudah selesai'),
-        ('.pkg', '🟡 Package file', 'PROBABLY SAFE - installer yang sudah selesai'),
-        ('.zip', '🟡 Archive file', 'PROBABLY SAFE - tapi cek dulu isinya'),
-        ('.rar', '🟡 Archive file', 'PROBABLY SAFE - tapi cek dulu isinya'),
-        ('.tar', '🟡 Archive file', 'PROBABLY SAFE - tapi cek dulu isinya'),
-        (' (1)', '🟡 Duplicate file', 'PROBABLY SAFE - kemungkinan duplicate'),
-        (' copy', '🟡 Copy file', 'PROBABLY SAFE - kemungkinan duplicate'),
-        ('/.Trashes/', '🟡 Trash file', 'PROBABLY SAFE - file yang sudah di trash'),
-    ]
-    
-    # NEEDS REVIEW - Be careful
-    needs_review_patterns = [
-        ('/downloads/', '🟠 Download file', 'NEEDS REVIEW - bisa jadi file penting'),
-        ('/documents/', '🟠 Document file', 'NEEDS REVIEW - kemungkinan dokumen penting'),
-        ('/desktop/', '🟠 Desktop file', 'NEEDS REVIEW - file di desktop'),
-        ('.mov', '🟠 Video file', 'NEEDS REVIEW - bisa jadi video penting'),
-        ('.mp4', '🟠 Video file', 'NEEDS REVIEW - bisa jadi video penting'),
-        ('.mkv', '🟠 Video file', 'NEEDS REVIEW - bisa jadi video penting'),
-        ('.avi', '🟠 Video file', 'NEEDS REVIEW - bisa jadi video penting'),
-        ('.iso', '🟠 Disk image', 'NEEDS REVIEW - bisa jadi backup penting'),
-    ]
-    
-    # DANGEROUS - Don't recommend deletion
-    dangerous_patterns = [
-        ('/system/', '🔴 System file', 'DANGEROUS - jangan dihapus!'),
-        ('/usr/', '🔴 System file', 'DANGEROUS - jangan dihapus!'),
-        ('/bin/', '🔴 System binary', 'DANGEROUS - jangan dihapus!'),
-        ('/sbin/', '🔴 System binary', 'DANGEROUS - jangan dihapus!'),
-        ('.app/', '🔴 Application', 'DANGEROUS - aplikasi aktif'),
-        ('.framework/', '🔴 Framework', 'DANGEROUS - system framework'),
-        ('system.log', '🔴 Active log', 'DANGEROUS - log aktif'),
-        ('/library/frameworks/', '🔴 System framework', 'DANGEROUS - jangan dihapus!'),
-    ]
-    
-    # Check in order of danger level
-    for pattern, reason, recommendation in dangerous_patterns:
-        if pattern in filepath_lower:
-            return 'DANGEROUS', reason, recommendation
-    
-    for pattern, reason, recommendation in needs_review_patterns:
-        if pattern in filepath_lower:
-            return 'NEEDS_REVIEW', reason, recommendation
-    
-    for pattern, reason, recommendation in probably_safe_patterns:
-        if pattern in filepath_lower:
-            return 'PROBABLY_SAFE', reason, recommendation
-    
-    for pattern, reason, recommendation in very_safe_patterns:
-        if pattern in filepath_lower:
-            return 'VERY_SAFE', reason, recommendation
-    
-    return 'UNKNOWN', '⚪ Unknown file type', 'UNKNOWN - cek manual dulu'
+    if _AUTOMATON is not None:
+        # One left-to-right scan over the automaton; the smallest meta tuple
+        # is the highest-severity (then earliest-listed) pattern that matched.
+        # The automaton stores lowercase patterns, so lower the path here
+        best = min((meta for _, meta in _AUTOMATON.iter(filepath.lower())),
+                   default=None)
+    else:
+        # IGNORECASE regex scans the path as-is - no lowercased copy per file.
+        # Collect every alternation hit so severity ranking matches the
+        # automaton path - a lone .search would stop at the leftmost match
+        best = min((_CLASSIFIER_META[match.lastgroup]
+                    for match in _CLASSIFIER_RE.finditer(filepath)),
+                   default=None)
+
+    if best is None:
+        return 'UNKNOWN', '⚪ Unknown file type', 'UNKNOWN - cek manual dulu'
+    _, _, level, reason, recommendation = best
+    return level, reason, recommendation
+
+# Probed once at import - shutil.which is a PATH scan, not a subprocess,
+# and saves a fork per deletion when 'trash' isn't installed
+_TRASH_BIN = shutil.which('trash')
+_TRASH_DIR = os.path.expanduser("~/.Trash")
+
+# Next duplicate suffix to try per basename, so trashing many same-named
+# files doesn't re-probe (1), (2), ... from scratch every call
+_trash_counters: Dict[str, int] = {}
+
+# Flush the --batch queue after this many accepted files
+_BATCH_FLUSH_SIZE = 32
+
+def batch_move_to_trash(filepaths: List[str]) -> bool:
+    """Move many files to Trash with a single Finder AppleScript call
+
+    One osascript fork for the whole batch instead of one trash/move per
+    file, and Finder performs the moves as one transaction.
+    """
+    if not filepaths:
+        return True
+    posix_list = ', '.join(
+        'POSIX file "{}"'.format(p.replace('\\', '\\\\').replace('"', '\\"'))
+        for p in filepaths)
+    script = f'tell application "Finder" to delete {{{posix_list}}}'
+    try:
+        result = subprocess.run(['osascript', '-e', script], capture_output=True)
+        return result.returncode == 0
+    except Exception:
+        return False
+
+def _format_ts(ts: float) -> str:
+    """Render a timestamp for display"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))
+
+def getch() -> str:
+    """Read a single keypress without waiting for Enter (cbreak mode)"""
+    fd = sys.stdin.fileno()
+    old = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        return sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+def _prompt_choice(prompt: str, default_action: str) -> str:
+    """Read one answer from the user, mapping Enter to default_action
+
+    On a real terminal a single keypress answers immediately; when stdin
+    is not a tty (piped answers, tests) fall back to line-based input()
+    """
+    if sys.stdin.isatty():
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        choice = getch()
+        if choice in ('\r', '\n'):
+            choice = default_action
+        # cbreak mode suppresses echo - show what was chosen
+        sys.stdout.write(choice + '\n')
+        sys.stdout.flush()
+        return choice.lower().strip()
+    choice = input(prompt).lower().strip()
+    return choice or default_action
 
 def move_to_trash(filepath: str) -> bool:
     """Move file to Trash (macOS) instead of permanent deletion"""
     try:
         # Use macOS 'trash' command if available (requires: brew install trash)
-        result = subprocess.run(['trash', filepath], capture_output=True)
-        if result.returncode == 0:
-            return True
-        
+        if _TRASH_BIN:
+            result = subprocess.run([_TRASH_BIN, filepath], capture_output=True)
+            if result.returncode == 0:
+                return True
+
         # Fallback: Move to ~/.Trash manually
-        trash_dir = os.path.expanduser("~/.Trash")
+        trash_dir = _TRASH_DIR
         if not os.path.exists(trash_dir):
             os.makedirs(trash_dir)
-        
+
+        # Trash must live on the same device: shutil.move would fall back to
+        # copying the whole file byte-by-byte across volumes, turning an O(1)
+        # rename into O(filesize) I/O the user never asked for
+        if os.stat(filepath).st_dev != os.stat(trash_dir).st_dev:
+            print(f"   ⚠️  File is on a different volume than ~/.Trash - "
+                  f"skipping (move would copy the whole file)")
+            return False
+
         filename = os.path.basename(filepath)
-        trash_path = os.path.join(trash_dir, filename)
-        
-        # Handle duplicate names in trash
-        counter = 1
         base_name, ext = os.path.splitext(filename)
-        while os.path.exists(trash_path):
-            new_name = f"{base_name} ({counter}){ext}"
-            trash_path = os.path.join(trash_dir, new_name)
-            counter += 1
-        
-        shutil.move(filepath, trash_path)
+
+        # Reserve a unique trash name atomically (O_EXCL) instead of the
+        # racy exists()-then-move probe, resuming from the last suffix
+        # this session used for the same basename
+        counter = _trash_counters.get(filename, 0)
+        while True:
+            name = filename if counter == 0 else f"{base_name} ({counter}){ext}"
+            trash_path = os.path.join(trash_dir, name)
+            try:
+                os.close(os.open(trash_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                counter += 1
+        _trash_counters[filename] = counter + 1
+
+        # Same device, so this is a pure metadata rename onto the
+        # placeholder we just reserved - no data copy
+        try:
+            os.replace(filepath, trash_path)
+        except OSError:
+            # Rename failed (e.g. source parent not writable) - release the
+            # reservation so retries don't litter ~/.Trash with empty files
+            _trash_counters[filename] = counter
+            os.unlink(trash_path)
+            raise
         return True
-        
+
     except Exception as e:
         print(f"   ❌ Error moving to trash: {e}")
         return False
 
-def find_large_files(min_size_mb: int = 100) -> List[Dict]:
+def find_large_files(min_size_mb: int = 100) -> List[FileRec]:
     """Find large files across common locations"""
     print(f"🔍 Searching for files larger than {min_size_mb}MB...")
     large_files = []
-    
-    # Search locations
+    min_bytes = min_size_mb * 1024 * 1024
+
+    # Search locations, walked in-process (no find subprocess, no sudo -
+    # directories we can't read are simply skipped)
     search_locations = [
-        ("User Home", f"find ~ -type f -size +{min_size_mb}M 2>/dev/null"),
-        ("System Caches", f"sudo find /Library/Caches -type f -size +{min_size_mb}M 2>/dev/null"),
-        ("System Logs", f"sudo find /private/var/log -type f -size +{min_size_mb}M 2>/dev/null"),
-        ("Applications", f"find /Applications -type f -size +{min_size_mb}M 2>/dev/null"),
+        ("User Home", os.path.expanduser("~")),
+        ("System Caches", "/Library/Caches"),
+        ("System Logs", "/private/var/log"),
+        ("Applications", "/Applications"),
     ]
-    
-    for location_name, cmd in search_locations:
+
+    def _walk_root(location_name: str, root: str) -> List[FileRec]:
         print(f"   Scanning {location_name}...")
-        output, code = run_command(cmd)
-        
-        if code == 0 and output:
-            files = output.strip().split('\n')
-            for filepath in files:
-                if filepath.strip():
-                    file_info = get_file_info(filepath)
-                    if 'error' not in file_info:
-                        safety_level, reason, recommendation = is_safe_to_delete(filepath)
-                        
-                        large_files.append({
-                            'filepath': filepath,
-                            'location': location_name,
-                            'size_bytes': file_info['size_bytes'],
-                            'size_human': file_info['size_human'],
-                            'modified': file_info['modified'],
-                            'accessed': file_info['accessed'],
-                            'safety_level': safety_level,
-                            'reason': reason,
-                            'recommendation': recommendation
-                        })
-    
-    # Sort by size (largest first)
-    large_files.sort(key=lambda x: x['size_bytes'], reverse=True)
+        return list(_walk(root, min_bytes))
+
+    # The walks spend their time blocked in readdir/stat syscalls (which
+    # release the GIL), so scanning the four roots on threads overlaps the
+    # I/O instead of paying each root's cold-cache latency back to back
+    with ThreadPoolExecutor(max_workers=len(search_locations)) as executor:
+        futures = {executor.submit(_walk_root, name, root): name
+                   for name, root in search_locations}
+        for future in as_completed(futures):
+            location_name = futures[future]
+            for file_info in future.result():
+                safety_level, reason, recommendation = is_safe_to_delete(file_info.filepath)
+                large_files.append(file_info._replace(
+                    location=location_name,
+                    safety_level=safety_level,
+                    reason=reason,
+                    recommendation=recommendation))
+
+    # Sort by size (largest first) - attrgetter skips a Python frame per key
+    large_files.sort(key=attrgetter('size_bytes'), reverse=True)
     return large_files
 
-def interactive_cleanup(large_files: List[Dict]):
-    """Interactive file-by-file cleanup"""
+def interactive_cleanup(large_files: List[FileRec], batch: bool = False):
+    """Interactive file-by-file cleanup
+
+    With batch=True accepted files are queued and committed to Trash in
+    Finder batches instead of one move per confirmation.
+    """
     if not large_files:
         print("🎉 No large files found!")
         return
     
     print(f"\n📊 Found {len(large_files)} large files")
-    print(f"Total size: {bytes_to_human(sum(f['size_bytes'] for f in large_files))}")
+    print(f"Total size: {bytes_to_human(sum(f.size_bytes for f in large_files))}")
     print("\n" + "="*80)
     print("🗑️  INTERACTIVE FILE CLEANUP")
     print("="*80)
@@ -229,42 +370,71 @@ def interactive_cleanup(large_files: List[Dict]):
     deleted_count = 0
     deleted_size = 0
     skipped_count = 0
-    
+    pending_batch: List[FileRec] = []
+
+    def _flush_batch():
+        nonlocal deleted_count, deleted_size
+        if not pending_batch:
+            return
+        if batch_move_to_trash([f.filepath for f in pending_batch]):
+            deleted_count += len(pending_batch)
+            deleted_size += sum(f.size_bytes for f in pending_batch)
+            print(f"   ✅ Moved {len(pending_batch)} queued files to Trash")
+        else:
+            # AppleScript failed - fall back to per-file moves
+            for queued in pending_batch:
+                if move_to_trash(queued.filepath):
+                    deleted_count += 1
+                    deleted_size += queued.size_bytes
+                else:
+                    print(f"   ❌ Failed to move to Trash: {queued.filepath}")
+        pending_batch.clear()
+
+    total_files = len(large_files)
     for i, file_info in enumerate(large_files, 1):
-        print(f"\n📄 File {i}/{len(large_files)}")
-        print(f"   Path: {file_info['filepath']}")
-        print(f"   Size: {file_info['size_human']}")
-        print(f"   Safety: {file_info['reason']}")
-        print(f"   Recommendation: {file_info['recommendation']}")
-        
+        # One buffered write per file instead of 6-8 flushing prints
+        lines = [f"\n📄 File {i}/{total_files}",
+                 f"   Path: {file_info.filepath}",
+                 f"   Size: {bytes_to_human(file_info.size_bytes)}",
+                 f"   Safety: {file_info.reason}",
+                 f"   Recommendation: {file_info.recommendation}"]
+
         # Show default action based on safety level
-        if file_info['safety_level'] == 'VERY_SAFE':
+        if file_info.safety_level == 'VERY_SAFE':
             default_action = "y"
-            print(f"   💡 Recommended: DELETE (press Enter for yes)")
-        elif file_info['safety_level'] == 'PROBABLY_SAFE':
+            lines.append("   💡 Recommended: DELETE (press Enter for yes)")
+        elif file_info.safety_level == 'PROBABLY_SAFE':
             default_action = "y"
-            print(f"   💡 Recommended: DELETE (but double-check)")
-        elif file_info['safety_level'] == 'DANGEROUS':
+            lines.append("   💡 Recommended: DELETE (but double-check)")
+        elif file_info.safety_level == 'DANGEROUS':
             default_action = "n"
-            print(f"   ⚠️  Recommended: KEEP (dangerous to delete)")
+            lines.append("   ⚠️  Recommended: KEEP (dangerous to delete)")
         else:
             default_action = "i"
-            print(f"   🤔 Recommended: CHECK INFO first")
+            lines.append("   🤔 Recommended: CHECK INFO first")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
         
         while True:
             try:
-                choice = input(f"\n   Delete this file? [{default_action}]: ").lower().strip()
-                if not choice:
-                    choice = default_action
-                
+                choice = _prompt_choice(f"\n   Delete this file? [{default_action}]: ",
+                                        default_action)
+
                 if choice in ['y', 'yes']:
-                    print(f"   🗑️  Moving to Trash...")
-                    if move_to_trash(file_info['filepath']):
-                        print(f"   ✅ Moved to Trash successfully!")
-                        deleted_count += 1
-                        deleted_size += file_info['size_bytes']
+                    if batch:
+                        pending_batch.append(file_info)
+                        print(f"   🗑️  Queued for Trash (batch mode)")
+                        if len(pending_batch) >= _BATCH_FLUSH_SIZE:
+                            _flush_batch()
                     else:
-                        print(f"   ❌ Failed to move to Trash")
+                        print(f"   🗑️  Moving to Trash...")
+                        if move_to_trash(file_info.filepath):
+                            print(f"   ✅ Moved to Trash successfully!")
+                            deleted_count += 1
+                            deleted_size += file_info.size_bytes
+                        else:
+                            print(f"   ❌ Failed to move to Trash")
                     break
                     
                 elif choice in ['n', 'no']:
@@ -277,30 +447,37 @@ def interactive_cleanup(large_files: List[Dict]):
                     break
                     
                 elif choice in ['i', 'info']:
-                    print(f"\n   📋 DETAILED INFO:")
-                    print(f"      Full path: {file_info['filepath']}")
-                    print(f"      Size: {file_info['size_human']} ({file_info['size_bytes']:,} bytes)")
-                    print(f"      Modified: {file_info['modified']}")
-                    print(f"      Last accessed: {file_info['accessed']}")
-                    print(f"      Location: {file_info['location']}")
-                    print(f"      Safety level: {file_info['safety_level']}")
+                    sys.stdout.write('\n'.join([
+                        "\n   📋 DETAILED INFO:",
+                        f"      Full path: {file_info.filepath}",
+                        f"      Size: {bytes_to_human(file_info.size_bytes)} ({file_info.size_bytes:,} bytes)",
+                        f"      Modified: {_format_ts(file_info.mtime)}",
+                        f"      Last accessed: {_format_ts(file_info.atime)}",
+                        f"      Location: {file_info.location}",
+                        f"      Safety level: {file_info.safety_level}",
+                    ]) + '\n')
+                    sys.stdout.flush()
                     
                 elif choice in ['o', 'open']:
                     print(f"   📂 Opening parent directory...")
-                    parent_dir = os.path.dirname(file_info['filepath'])
+                    parent_dir = os.path.dirname(file_info.filepath)
                     subprocess.run(['open', parent_dir])
                     
                 elif choice in ['q', 'quit']:
                     print(f"\n⏹️  Cleanup cancelled by user")
+                    _flush_batch()
                     return
-                    
+
                 else:
                     print(f"   ❓ Invalid choice. Use: y, n, s, i, o, q")
-                    
+
             except KeyboardInterrupt:
                 print(f"\n\n⏹️  Cleanup cancelled by user")
+                _flush_batch()
                 return
-    
+
+    _flush_batch()
+
     # Summary
     print(f"\n" + "="*60)
     print(f"🎉 CLEANUP COMPLETE!")
@@ -317,21 +494,27 @@ def interactive_cleanup(large_files: List[Dict]):
 def main():
     """Main function"""
     # Parse command line arguments
+    args = sys.argv[1:]
+    batch = '--batch' in args
+    if batch:
+        args.remove('--batch')
+
     min_size_mb = 100  # default
-    if len(sys.argv) > 1:
+    if args:
         try:
-            min_size_mb = int(sys.argv[1])
+            min_size_mb = int(args[0])
         except ValueError:
-            print(f"❌ Invalid size: {sys.argv[1]}. Using default 100MB")
-    
+            print(f"❌ Invalid size: {args[0]}. Using default 100MB")
+
     print(f"🚀 Interactive Large File Cleaner")
     print(f"Minimum file size: {min_size_mb}MB")
+    if batch:
+        print(f"Batch mode: accepted files committed to Trash in groups of {_BATCH_FLUSH_SIZE}")
     print(f"Files will be moved to Trash (not permanently deleted)")
     print("="*60)
     
-    # Check if 'trash' command is available
-    result = subprocess.run(['which', 'trash'], capture_output=True)
-    if result.returncode != 0:
+    # Check if 'trash' command is available (probed once at import)
+    if not _TRASH_BIN:
         print("💡 Tip: Install 'trash' command for better Trash integration:")
         print("   brew install trash")
         print("   (Using fallback method for now)\n")
@@ -340,7 +523,7 @@ def main():
     large_files = find_large_files(min_size_mb)
     
     # Interactive cleanup
-    interactive_cleanup(large_files)
+    interactive_cleanup(large_files, batch=batch)
 
 if __name__ == "__main__":
     main()